@@ -6,9 +6,14 @@ import bittensor
 # standart imports
 import asyncio
 from collections import namedtuple
-import json
+import contextlib
+import dataclasses
+import math
+import mmap
 import numpy
+import orjson
 import os
+import pickle
 import re
 import time
 
@@ -23,23 +28,231 @@ from subnet_constants import (
 )
 
 
-class SubnetDataBase:
-    ValidatorData = namedtuple(
-        "ValidatorData", [
-            "subnet_emission",
-            "blocks",
-            "block_data",
+DEFAULT_CACHE_FOLDER = os.path.join(
+    os.path.expanduser("~"), ".cache", "vali-weight-intervals", "metagraphs"
+)
+
+
+class BlockMetagraphCache:
+    # Historical blocks are immutable so cached entries never go stale.
+    # Only the metagraph fields actually consumed downstream are stored,
+    # keeping the pickles small.
+    cache_file_name = "metagraph.pkl"
+
+    # Entries never go stale but the walk keeps reaching new boundary
+    # blocks, so without a bound the folder grows forever across runs.
+    # The newest max_cache_files entries are kept and the rest pruned
+    # when the cache is opened.
+    max_cache_files = 10000
+
+    MetagraphSnapshot = namedtuple(
+        "MetagraphSnapshot", [
+            "netuid",
+            "last_update",
+            "Tv",
+            "E",
+            "S",
+            "coldkeys",
+            "hotkeys",
         ]
     )
-    BlockData = namedtuple(
-        "BlockData", [
-            "rizzo_emission",
-            "rizzo_vtrust",
-            "avg_vtrust",
-            "rizzo_updated",
-        ]
+    # namedtuple doesn't know it lives inside a class, so its qualname
+    # must be patched for pickle to find it when loading cache files.
+    MetagraphSnapshot.__qualname__ = "BlockMetagraphCache.MetagraphSnapshot"
+
+    def __init__(self, cache_folder):
+        self._cache_folder = cache_folder
+        self._memory_cache = {}
+
+        os.makedirs(cache_folder, exist_ok=True)
+        self._prune()
+
+    def _prune(self):
+        cache_base, cache_ext = os.path.splitext(self.cache_file_name)
+        cache_files = []
+        with os.scandir(self._cache_folder) as entries:
+            for entry in entries:
+                if (
+                    entry.name.startswith(f"{cache_base}.")
+                    and entry.name.endswith(cache_ext)
+                ):
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        # Another worker pruning the same folder already
+                        # removed it.
+                        continue
+                    cache_files.append((mtime, entry.path))
+
+        excess = len(cache_files) - self.max_cache_files
+        if excess <= 0:
+            return
+
+        cache_files.sort()
+        for _, cache_file in cache_files[:excess]:
+            try:
+                os.remove(cache_file)
+            except OSError:
+                # Another worker pruning the same folder already got it.
+                pass
+
+    def _get_cache_file(self, netuid, block):
+        cache_base, cache_ext = os.path.splitext(self.cache_file_name)
+        return os.path.join(
+            self._cache_folder, f"{cache_base}.{netuid}.{block}{cache_ext}"
+        )
+
+    def get(self, netuid, block):
+        key = (netuid, block)
+        if key in self._memory_cache:
+            return self._memory_cache[key]
+
+        cache_file = self._get_cache_file(netuid, block)
+        if not os.path.isfile(cache_file):
+            return None
+
+        try:
+            with open(cache_file, "rb") as fd:
+                snapshot = pickle.load(fd)
+        except (pickle.UnpicklingError, EOFError):
+            # A partially written cache file is treated as a miss.
+            return None
+
+        self._memory_cache[key] = snapshot
+        return snapshot
+
+    def store(self, metagraph, block):
+        snapshot = self.MetagraphSnapshot(
+            netuid=metagraph.netuid,
+            last_update=numpy.asarray(metagraph.last_update),
+            Tv=numpy.asarray(metagraph.Tv),
+            E=numpy.asarray(metagraph.E),
+            S=numpy.asarray(metagraph.S),
+            coldkeys=list(metagraph.coldkeys),
+            hotkeys=list(metagraph.hotkeys),
+        )
+        self._memory_cache[(snapshot.netuid, block)] = snapshot
+        with open(self._get_cache_file(snapshot.netuid, block), "wb") as fd:
+            pickle.dump(snapshot, fd)
+
+        return snapshot
+
+
+def _compute_rizzo_uid(metagraph, other_coldkey, last_uid=None):
+    if not other_coldkey and metagraph.netuid in MULTI_UID_HOTKEYS:
+        keys = metagraph.hotkeys
+        key = MULTI_UID_HOTKEYS[metagraph.netuid]
+    else:
+        keys = metagraph.coldkeys
+        key = other_coldkey or RIZZO_COLDKEY
+
+    # The uid rarely changes between consecutive blocks, so check the
+    # previously found uid before paying for a scan of the key list.
+    if last_uid is not None and last_uid < len(keys):
+        if keys[last_uid] == key:
+            return last_uid
+
+    # Build the key-to-uid index in one pass rather than scanning the
+    # key list with list.index. setdefault keeps the first uid for
+    # duplicated keys, matching list.index - the validator does hold
+    # multiple uids on some subnets (see MULTI_UID_HOTKEYS).
+    key_index = {}
+    for i, k in enumerate(keys):
+        key_index.setdefault(k, i)
+    uid = key_index.get(key)
+    if uid is None:
+        raise ValueError(f"{key} is not in the metagraph")
+    return uid
+
+
+def _compute_block_data(
+        metagraph, other_coldkey, last_weight_set_block, last_rizzo_uid=None
+    ):
+    # Pure CPU work kept at module level so the interval walks can hand
+    # it to an executor without tying up the event loop.
+    rizzo_uid = _compute_rizzo_uid(metagraph, other_coldkey, last_rizzo_uid)
+
+    stakes = numpy.asarray(metagraph.S, dtype=numpy.float32)
+    vtrusts = numpy.asarray(metagraph.Tv, dtype=numpy.float32)
+    last_updates = numpy.asarray(metagraph.last_update, dtype=numpy.int64)
+
+    # Read through the int64 array and cast at the struct boundary so
+    # downstream consumers see plain Python ints, not numpy scalars.
+    prev_weight_set_block = int(last_updates[rizzo_uid])
+    interval = int(last_weight_set_block) - prev_weight_set_block
+    rizzo_vtrust = metagraph.Tv[rizzo_uid]
+    rizzo_emission = metagraph.E[rizzo_uid]
+
+    # Get all other validator uids that have valid stake amount and
+    # proper VT and U.
+    valid_mask = (
+        (stakes > MIN_STAKE_THRESHOLD)
+        & (vtrusts > MIN_VTRUST_THRESHOLD)
+        & (last_weight_set_block - last_updates < MAX_U_THRESHOLD)
+    )
+    valid_mask[rizzo_uid] = False
+
+    if not valid_mask.any():
+        avg_vtrust = numpy.nan
+    else:
+        # The unweighted mean - ndarray.mean skips numpy.average's
+        # weights dispatch and hands back a plain Python float.
+        avg_vtrust = float(vtrusts[valid_mask].mean())
+
+    return (
+        rizzo_emission, rizzo_vtrust, avg_vtrust, interval,
+        prev_weight_set_block, rizzo_uid
     )
 
+
+class SubnetDataBase:
+    # The per-interval data is stored as parallel numpy arrays (one per
+    # field) rather than a list of per-block records - 5 contiguous
+    # arrays instead of num_intervals small heap objects, and status
+    # evaluation and serialization become bulk array operations.
+    # avg_vtrust holds NaN for intervals with no other valid validators.
+    @dataclasses.dataclass(slots=True)
+    class ValidatorData:
+        subnet_emission: float
+        blocks: numpy.ndarray
+        rizzo_emission: numpy.ndarray
+        rizzo_vtrust: numpy.ndarray
+        avg_vtrust: numpy.ndarray
+        rizzo_updated: numpy.ndarray
+
+        array_dtypes = {
+            "blocks": numpy.int64,
+            "rizzo_emission": numpy.float32,
+            "rizzo_vtrust": numpy.float32,
+            "avg_vtrust": numpy.float32,
+            "rizzo_updated": numpy.int64,
+        }
+
+        @classmethod
+        def empty(cls, subnet_emission, num_intervals=0):
+            return cls(
+                subnet_emission=subnet_emission,
+                **{
+                    field: numpy.empty(num_intervals, dtype=dtype)
+                    for field, dtype in cls.array_dtypes.items()
+                }
+            )
+
+        def preallocate(self, num_intervals):
+            for field, dtype in self.array_dtypes.items():
+                setattr(self, field, numpy.empty(num_intervals, dtype=dtype))
+
+        def truncate(self, num_intervals):
+            for field in self.array_dtypes:
+                setattr(self, field, getattr(self, field)[:num_intervals])
+
+        def merge(self, other, num_intervals):
+            for field in self.array_dtypes:
+                merged = numpy.concatenate(
+                    [getattr(self, field), getattr(other, field)]
+                )
+                setattr(self, field, merged[:num_intervals])
+
     def __init__(self, verbose):
         self._verbose = verbose
         self._validator_data = {}
@@ -52,56 +265,110 @@ class SubnetDataBase:
         return self._validator_data
 
     def _get_rizzo_uid(self, metagraph):
-        if not self._other_coldkey and metagraph.netuid in MULTI_UID_HOTKEYS:
-            return metagraph.hotkeys.index(
-                MULTI_UID_HOTKEYS[metagraph.netuid]
-            )
-
-        coldkey = self._other_coldkey or RIZZO_COLDKEY
-        return metagraph.coldkeys.index(coldkey)
+        return _compute_rizzo_uid(metagraph, self._other_coldkey)
 
     def _print_verbose(self, message):
         if self._verbose:
             print(message)
 
     def to_dict(self):
-        def serializable(value):
-            if isinstance(value, self.BlockData):
-                return namedtuple_to_dict(value)
-            if isinstance(value, list):
-                return [serializable(v) for v in value]
-            if isinstance(value, numpy.float32):
-                return float(value)
-            if isinstance(value, numpy.int64):
-                return int(value)
-            return value
-
-        def namedtuple_to_dict(data):
-            return dict(
-                [(f, serializable(getattr(data, f))) for f in data._fields]
-            )
-
         data_dict = {}
         for key in self._validator_data:
-            data = self._validator_data[key]
-            data_dict[key] = namedtuple_to_dict(data)
+            data_dict[key] = self.to_dict_for_netuid(key)
         return data_dict
 
+    def to_dict_for_netuid(self, netuid):
+        # The schema is fixed, so walk the known fields directly rather
+        # than recursing through the data with per-value isinstance
+        # checks. Casting to float/int also takes care of coercing any
+        # numpy scalars for json serialization.
+        data = self._validator_data[netuid]
+        return {
+            "subnet_emission": (
+                None if data.subnet_emission is None
+                else float(data.subnet_emission)
+            ),
+            "blocks": data.blocks.tolist(),
+            "block_data": [
+                {
+                    "rizzo_emission": rizzo_emission,
+                    "rizzo_vtrust": rizzo_vtrust,
+                    "avg_vtrust": (
+                        None if math.isnan(avg_vtrust) else avg_vtrust
+                    ),
+                    "rizzo_updated": rizzo_updated,
+                }
+                for (rizzo_emission, rizzo_vtrust, avg_vtrust,
+                     rizzo_updated) in zip(
+                    data.rizzo_emission.tolist(),
+                    data.rizzo_vtrust.tolist(),
+                    data.avg_vtrust.tolist(),
+                    data.rizzo_updated.tolist(),
+                )
+            ],
+        }
+
+    def write_npz_file(self, netuid, npz_folder):
+        # Compact binary alternative to the json files - the arrays are
+        # written as-is (NaN included), so there is no None encoding and
+        # reading them back is an array copy rather than a parse.
+        npz_file = os.path.join(
+            npz_folder, SubnetDataFromNpz.get_npz_file_name(netuid)
+        )
+        self._print_verbose(f"\nWriting data to file: {npz_file}")
+        data = self._validator_data[netuid]
+        numpy.savez_compressed(
+            npz_file,
+            subnet_emission=numpy.float32(
+                numpy.nan if data.subnet_emission is None
+                else data.subnet_emission
+            ),
+            **{
+                field: getattr(data, field)
+                for field in self.ValidatorData.array_dtypes
+            }
+        )
+
     def _get_subnet_data(self):
         raise NotImplementedError
 
 
 class SubnetData(SubnetDataBase):
+    # Cap on the number of in-flight metagraph requests so a large
+    # asyncio.gather doesn't overload the subtensor websocket.
+    default_max_concurrency = 16
+    # Number of predicted weight-setting boundary blocks each interval
+    # walk keeps in flight ahead of the block it is processing.
+    speculation_depth = 4
+
     def __init__(
             self, netuids, num_intervals, network, chunk_size=0,
-            other_coldkey=None, existing_data=None, verbose=False
+            other_coldkey=None, existing_data=None, max_concurrency=0,
+            cache_folder=None, write_json_folder=None,
+            write_npz_folder=None, verbose=False
         ):
         self._netuids = netuids
-        self._network = network
+        # network may be a single network/endpoint or a prioritized list
+        # of fallbacks to rotate through on repeated fetch failures.
+        if isinstance(network, str):
+            network = [network]
+        self._networks = list(network)
+        self._subtensors = []
         self._chunk_size = chunk_size or len(self._netuids)
         self._num_intervals = num_intervals
         self._other_coldkey = self._get_other_coldkey(other_coldkey)
         self._existing_data = existing_data or {}
+        self._max_concurrency = max_concurrency or self.default_max_concurrency
+        self._semaphore = None
+        # The block cache is on by default - pass cache_folder=False to
+        # disable it, or a path to cache somewhere else.
+        if cache_folder is None:
+            cache_folder = DEFAULT_CACHE_FOLDER
+        self._metagraph_cache = (
+            BlockMetagraphCache(cache_folder) if cache_folder else None
+        )
+        self._write_json_folder = write_json_folder
+        self._write_npz_folder = write_npz_folder
 
         super(SubnetData, self).__init__(verbose)
 
@@ -120,24 +387,35 @@ class SubnetData(SubnetDataBase):
     async def _async_get_subnet_data(self):
         self._print_verbose(f"\nGathering data in chunks of {self._chunk_size}")
 
-        # Get subtensor.
-        self._print_verbose(f"\nConnecting to subtensor network: {self._network}")
-        async with bittensor.AsyncSubtensor(network=self._network) as subtensor:
-            max_attempts = 5
+        # Create the sync primitives here so they bind to the running
+        # event loop.
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._subtensor_lock = asyncio.Lock()
+
+        # The first network is the primary, the rest are fallbacks
+        # rotated through when fetches keep failing. Fallback
+        # connections are opened lazily on first rotation; every opened
+        # connection stays on the exit stack for the whole run so
+        # retries always reuse an established websocket.
+        async with contextlib.AsyncExitStack() as stack:
+            self._exit_stack = stack
+            self._subtensors = [None] * len(self._networks)
+            subtensor = await self._get_subtensor(0)
+
+            # Failures are retried with backoff inside each subnet's
+            # pipeline, so one flaky subnet no longer forces a full pass
+            # over the whole chunk.
             for netuids in self._get_chunks():
-                for attempt in range(1, max_attempts+1):
-                    self._print_verbose(f"\nAttempt {attempt} of {max_attempts}")
-                    await self._get_validator_data(subtensor, netuids)
-
-                    # Get netuids missing data
-                    netuids = list(set(netuids).difference(set(self._validator_data)))
-                    if netuids:
-                        self._print_verbose(
-                            "\nFailed to gather data for subnets: "
-                            f"{', '.join([str(n) for n in netuids])}."
-                        )
-                    else:
-                        break
+                await self._get_validator_data(subtensor, netuids)
+
+                netuids = [
+                    n for n in netuids if n not in self._validator_data
+                ]
+                if netuids:
+                    self._print_verbose(
+                        "\nFailed to gather data for subnets: "
+                        f"{', '.join([str(n) for n in netuids])}."
+                    )
 
     def _get_chunks(self):
         num_netuids = len(self._netuids)
@@ -151,6 +429,101 @@ class SubnetData(SubnetDataBase):
                 yield self._netuids[netuid_start:netuid_end]
                 netuid_start = netuid_end
 
+    async def _get_subtensor(self, index):
+        async with self._subtensor_lock:
+            if self._subtensors[index] is None:
+                self._print_verbose(
+                    f"\nConnecting to subtensor network: "
+                    f"{self._networks[index]}"
+                )
+                self._subtensors[index] = (
+                    await self._exit_stack.enter_async_context(
+                        bittensor.AsyncSubtensor(
+                            network=self._networks[index]
+                        )
+                    )
+                )
+        return self._subtensors[index]
+
+    async def _get_metagraph(self, subtensor, netuid, block):
+        async with self._semaphore:
+            return await subtensor.metagraph(netuid=netuid, block=block)
+
+    async def _get_metagraph_fields(self, subtensor, netuid, block):
+        # The full metagraph call materializes the entire subnet state
+        # including the O(N^2) weights and bonds matrices which the
+        # interval walk never reads. get_metagraph_info with
+        # field_indices skips the heavyweight object construction and
+        # only moves the needed fields over the wire; older bittensor
+        # versions don't have it so fall back to neurons_lite.
+        try:
+            return await self._get_metagraph_info_fields(
+                subtensor, netuid, block
+            )
+        except AttributeError:
+            return await self._get_neurons_lite_fields(
+                subtensor, netuid, block
+            )
+
+    async def _get_metagraph_info_fields(self, subtensor, netuid, block):
+        field_indices = [
+            bittensor.SelectiveMetagraphIndex.Hotkeys,
+            bittensor.SelectiveMetagraphIndex.Coldkeys,
+            bittensor.SelectiveMetagraphIndex.LastUpdate,
+            bittensor.SelectiveMetagraphIndex.ValidatorTrust,
+            bittensor.SelectiveMetagraphIndex.Emission,
+            bittensor.SelectiveMetagraphIndex.TotalStake,
+        ]
+        async with self._semaphore:
+            metagraph_info = await subtensor.get_metagraph_info(
+                netuid, field_indices=field_indices, block=block
+            )
+
+        return BlockMetagraphCache.MetagraphSnapshot(
+            netuid=netuid,
+            last_update=numpy.asarray(
+                metagraph_info.last_update, dtype=numpy.int64
+            ),
+            Tv=numpy.asarray(
+                metagraph_info.validator_trust, dtype=numpy.float32
+            ),
+            E=numpy.asarray(
+                [float(emission) for emission in metagraph_info.emission],
+                dtype=numpy.float32
+            ),
+            S=numpy.asarray(
+                [float(stake) for stake in metagraph_info.total_stake],
+                dtype=numpy.float32
+            ),
+            coldkeys=list(metagraph_info.coldkeys),
+            hotkeys=list(metagraph_info.hotkeys),
+        )
+
+    async def _get_neurons_lite_fields(self, subtensor, netuid, block):
+        async with self._semaphore:
+            neurons = await subtensor.neurons_lite(netuid=netuid, block=block)
+
+        neurons = sorted(neurons, key=lambda neuron: neuron.uid)
+        return BlockMetagraphCache.MetagraphSnapshot(
+            netuid=netuid,
+            last_update=numpy.asarray(
+                [neuron.last_update for neuron in neurons], dtype=numpy.int64
+            ),
+            Tv=numpy.asarray(
+                [neuron.validator_trust for neuron in neurons],
+                dtype=numpy.float32
+            ),
+            E=numpy.asarray(
+                [neuron.emission for neuron in neurons], dtype=numpy.float32
+            ),
+            S=numpy.asarray(
+                [float(neuron.total_stake) for neuron in neurons],
+                dtype=numpy.float32
+            ),
+            coldkeys=[neuron.coldkey for neuron in neurons],
+            hotkeys=[neuron.hotkey for neuron in neurons],
+        )
+
     async def _get_validator_data(self, subtensor, all_netuids):
         start_time = time.time()
         self._print_verbose(f"\nObtaining data for subnets: {all_netuids}\n")
@@ -158,185 +531,241 @@ class SubnetData(SubnetDataBase):
         # Get the block to pass to async calls so everything is in sync
         block = await subtensor.block
 
-        # Get the metagraphs.
-        metagraphs = await asyncio.gather(
-            *[
-                subtensor.metagraph(netuid=netuid, block=block)
-                for netuid in all_netuids
-            ]
-        )
+        # Each subnet's pipeline (chain-tip metagraph fetch plus the
+        # backward interval walk) is independent of the others, so the
+        # pipelines run end-to-end concurrently - no subnet waits for
+        # every tip fetch before starting its walk. The fetch semaphore
+        # caps the in-flight RPCs, and consuming the pipelines with
+        # as_completed reports each subnet as soon as it lands instead
+        # of blocking on the slowest one.
+        for pipeline in asyncio.as_completed([
+            self._gather_subnet_data(subtensor, netuid, block)
+            for netuid in all_netuids
+        ]):
+            netuid = await pipeline
+            self._print_verbose(
+                f"Finished gathering weight setting intervals "
+                f"for subnet {netuid}."
+            )
 
-        block_to_stop = {}
-        last_weight_set_block = {}
-        for ni, netuid in enumerate(all_netuids):
-            metagraph = metagraphs[ni]
-            # Get emission percentages.
-            # Multiplying by 2 since tao has been halved?
-            subnet_emission = metagraph.emissions.tao_in_emission * 100 * 2
+        for netuid in all_netuids:
+            # Subnets whose tip fetch exhausted its attempts never got a
+            # ValidatorData entry - they were reported above and are
+            # skipped here rather than failing the merge/write.
+            if netuid not in self._validator_data:
+                continue
 
-            self._validator_data[netuid] = self.ValidatorData(
-                subnet_emission=subnet_emission,
-                blocks=[],
-                block_data=[],
+            existing_data = self._existing_data.get(netuid)
+            if existing_data:
+                self._validator_data[netuid].merge(
+                    existing_data, self._num_intervals
+                )
+
+            # Persist each subnet as soon as its data is final so a
+            # failure later in the run doesn't throw away completed
+            # subnets - the next run picks them up as existing data.
+            if self._write_json_folder:
+                self._write_json_file(netuid)
+            if self._write_npz_folder:
+                self.write_npz_file(netuid, self._write_npz_folder)
+
+        total_time = time.time() - start_time
+        self._print_verbose(
+            f"Subnet data gathered in {int(total_time)} seconds."
+        )
+
+    def _write_json_file(self, netuid):
+        json_file = os.path.join(
+            self._write_json_folder,
+            SubnetDataFromJson.get_json_file_name(netuid)
+        )
+        self._print_verbose(f"\nWriting data to file: {json_file}")
+        with open(json_file, "wb") as fd:
+            fd.write(
+                orjson.dumps(
+                    {str(netuid): self.to_dict_for_netuid(netuid)},
+                    option=orjson.OPT_INDENT_2
+                )
             )
 
-            # Get UID for Rizzo.
+    async def _gather_subnet_data(self, subtensor, netuid, block):
+        # The chain-tip fetch gets the same retry treatment as the
+        # historical fetches - backoff between attempts so a transient
+        # failure on one subnet doesn't abort the whole gather.
+        metagraph = None
+        max_attempts = 5
+        for attempt in range(max_attempts):
             try:
-                rizzo_uid = self._get_rizzo_uid(metagraph)
-            except ValueError:
+                metagraph = await self._get_metagraph(
+                    subtensor, netuid, block
+                )
+                break
+            except Exception as err:
                 self._print_verbose(
-                    f"WARNING: Rizzo validator not running on subnet {netuid}"
+                    f"failed attempt: {attempt+1}, netuid: {netuid}, "
+                    f"block: {block}, error: {err}"
                 )
-                continue
+                await asyncio.sleep(0.5 * (1.5 ** attempt))
 
-            last_weight_set_block[netuid] = metagraph.last_update[rizzo_uid]
+        if metagraph is None:
+            return netuid
 
-            if self._existing_data.get(netuid):
-                block_to_stop[netuid] = (
-                    self._existing_data[netuid].blocks[0]
-                        if self._existing_data[netuid].blocks
-                    else 0  # last_weight_set_block[netuid] - 1
-                )
-            else:
-                block_to_stop[netuid] = 0
+        # Get emission percentages.
+        # Multiplying by 2 since tao has been halved?
+        subnet_emission = metagraph.emissions.tao_in_emission * 100 * 2
 
-        netuids = all_netuids[:]
-        for _ in range(self._num_intervals):
-            netuids = [
-                n for n in netuids
-                if n in block_to_stop
-                and last_weight_set_block[n] > block_to_stop[n]
-            ]
+        self._validator_data[netuid] = self.ValidatorData.empty(
+            subnet_emission
+        )
 
-            if not netuids:
-                break
+        # Get UID for Rizzo.
+        try:
+            rizzo_uid = self._get_rizzo_uid(metagraph)
+        except ValueError:
+            self._print_verbose(
+                f"WARNING: Rizzo validator not running on subnet {netuid}"
+            )
+            return netuid
 
-            #
-            # For some reason this raises random errors:
-            #     "Failed to decode type: "scale_info::580" with type id: 580"
-            # and it seems non-deterministic.
-            # Putting this in a loop.
-            #
-            metagraphs = {}
-            netuids_remaining = netuids[:]
-            max_attemps = 3
-            for attempt in range(max_attemps):
-                self._print_verbose(f"Attempt {attempt+1}: {netuids_remaining}")
-                mgs = await asyncio.gather(
-                    *[
-                        self.get_metagraph_for_netuid_at_block(
-                            subtensor, netuid, int(last_weight_set_block[netuid]) - 1
-                        )
-                        for netuid in netuids_remaining
-                    ]
-                )
-                failed_netuids = []
-                for ni, netuid in enumerate(netuids_remaining):
-                    if mgs[ni]:
-                        metagraphs[netuid] = mgs[ni]
-                    else:
-                        failed_netuids.append(netuid)
-                if not failed_netuids:
+        last_weight_set_block = int(metagraph.last_update[rizzo_uid])
+
+        existing_data = self._existing_data.get(netuid)
+        if existing_data:
+            block_to_stop = (
+                int(existing_data.blocks[0])
+                    if len(existing_data.blocks)
+                else 0  # last_weight_set_block - 1
+            )
+        else:
+            block_to_stop = 0
+
+        await self._walk_weight_set_intervals(
+            subtensor, netuid, last_weight_set_block, block_to_stop,
+            rizzo_uid
+        )
+        return netuid
+
+    async def _walk_weight_set_intervals(
+            self, subtensor, netuid, last_weight_set_block, block_to_stop,
+            rizzo_uid=None
+        ):
+        # Preallocate the full interval window once; entries are assigned
+        # by index and the arrays trimmed to the filled count at the end.
+        validator_data = self._validator_data[netuid]
+        validator_data.preallocate(self._num_intervals)
+        count = 0
+
+        # The exact next boundary block is only known once the current
+        # fetch lands, but the weight setting tempo is regular on most
+        # subnets, so a small window of predicted boundaries is fetched
+        # speculatively while the walk catches up. A hit means the
+        # round-trip is already paid; a miss (irregular tempo) costs one
+        # discarded prefetch per speculated block and falls back to the
+        # exact fetch.
+        predicted_interval = 0
+        speculative = {}
+
+        try:
+            while count < self._num_intervals:
+                if last_weight_set_block <= block_to_stop:
                     break
-                netuids_remaining = failed_netuids
 
-            for netuid in netuids:
-                if netuid not in metagraphs:
-                    self._print_verbose(
-                        f"Unable to obtain all {self._num_intervals} "
-                        f"weight setting intervals for subnet {netuid}."
+                fetch_block = int(last_weight_set_block) - 1
+
+                # Consume (or invalidate) the previous iterations'
+                # predictions before seeding new ones, so a prediction
+                # seeded here survives to be popped on a later
+                # iteration rather than being cancelled immediately.
+                speculative_task = speculative.pop(fetch_block, None)
+                if speculative_task is None:
+                    # The predictions diverged from the real boundaries,
+                    # so anything still in flight is for the wrong
+                    # blocks.
+                    self._cancel_speculative_fetches(speculative)
+
+                if predicted_interval > 0:
+                    predicted_block = fetch_block
+                    while len(speculative) < self.speculation_depth:
+                        predicted_block -= predicted_interval
+                        if predicted_block <= block_to_stop:
+                            break
+                        if predicted_block not in speculative:
+                            speculative[predicted_block] = (
+                                asyncio.create_task(
+                                    self.get_metagraph_for_netuid_at_block(
+                                        subtensor, netuid, predicted_block
+                                    )
+                                )
+                            )
+
+                if speculative_task is not None:
+                    metagraph = await speculative_task
+                else:
+                    metagraph = await self.get_metagraph_for_netuid_at_block(
+                        subtensor, netuid, fetch_block
                     )
-                    del block_to_stop[netuid]
-                    continue
 
-                metagraph = metagraphs[netuid]
                 if not metagraph:
                     self._print_verbose(
                         f"Unable to obtain all {self._num_intervals} "
                         f"weight setting intervals for subnet {netuid}."
                     )
-                    del block_to_stop[netuid]
-                    continue
-
-                # Get UID for Rizzo.
-                try:
-                    rizzo_uid = self._get_rizzo_uid(metagraph)
-                except ValueError:
-                    self._print_verbose(
-                        f"Unable to obtain all {self._num_intervals} "
-                        f"weight setting intervals for subnet {netuid}."
-                    )
-                    del block_to_stop[netuid]
-                    continue
+                    break
 
-                # There's some weirdness going on with sn72. Catching it here.
+                # Hand the CPU-bound post-processing to the event loop's
+                # thread pool so the loop keeps servicing the other
+                # walks' websocket traffic. A process pool would
+                # parallelize the numpy work too, but
+                # write_intervals_data runs SubnetData inside daemonic
+                # multiprocessing.Pool workers which are not allowed to
+                # spawn child processes.
+                #
+                # ValueError means Rizzo is not in the metagraph;
+                # IndexError catches some weirdness going on with sn72.
                 try:
-                    prev_weight_set_block = metagraph.last_update[rizzo_uid]
-                    interval = last_weight_set_block[netuid] - prev_weight_set_block
-                    rizzo_vtrust = metagraph.Tv[rizzo_uid]
-                    rizzo_emission = metagraph.E[rizzo_uid]
-
-                    # Get all validator uids that have valid stake amount
-                    all_uids = [
-                        i for (i, s) in enumerate(metagraph.S)
-                        if i != rizzo_uid and s > MIN_STAKE_THRESHOLD
-                    ]
-                    # Get all validators that have proper VT and U
-                    valid_uids = [
-                        i for i in all_uids
-                        if (metagraph.Tv[i] > MIN_VTRUST_THRESHOLD)
-                        & (
-                            last_weight_set_block[netuid] - metagraph.last_update[i]
-                            < MAX_U_THRESHOLD
+                    (rizzo_emission, rizzo_vtrust, avg_vtrust, interval,
+                     prev_weight_set_block, rizzo_uid) = (
+                        await asyncio.get_running_loop().run_in_executor(
+                            None, _compute_block_data,
+                            metagraph, self._other_coldkey,
+                            last_weight_set_block, rizzo_uid
                         )
-                    ]
-
-                    if not valid_uids:
-                        avg_vtrust = None
-                    else:
-                        # Get min/max/average vTrust values.
-                        # vtrusts = [metagraph.Tv[uid] for uid in valid_uids]
-                        avg_vtrust = numpy.average(metagraph.Tv[valid_uids])
-                except IndexError:
+                    )
+                except (ValueError, IndexError):
                     self._print_verbose(
                         f"Unable to obtain all {self._num_intervals} "
                         f"weight setting intervals for subnet {netuid}."
                     )
-                    del block_to_stop[netuid]
-                    continue
-
-                block_data = self.BlockData(
-                    rizzo_emission=rizzo_emission,
-                    rizzo_vtrust=rizzo_vtrust,
-                    avg_vtrust=avg_vtrust,
-                    rizzo_updated=interval,
-                )
-                self._validator_data[netuid].blocks.append(last_weight_set_block[netuid])
-                self._validator_data[netuid].block_data.append(block_data)
+                    break
 
-                last_weight_set_block[netuid] = prev_weight_set_block
+                validator_data.blocks[count] = last_weight_set_block
+                validator_data.rizzo_emission[count] = rizzo_emission
+                validator_data.rizzo_vtrust[count] = rizzo_vtrust
+                validator_data.avg_vtrust[count] = avg_vtrust
+                validator_data.rizzo_updated[count] = interval
+                count += 1
 
-        for netuid in all_netuids:
-            if self._existing_data.get(netuid):
-                self._validator_data[netuid].blocks.extend(
-                    self._existing_data[netuid].blocks
-                )
-                self._validator_data[netuid].block_data.extend(
-                    self._existing_data[netuid].block_data
-                )
-                if len(self._validator_data[netuid].blocks) > self._num_intervals:
-                    self._validator_data[netuid] = self.ValidatorData(
-                        subnet_emission=self._validator_data[netuid].subnet_emission,
-                        blocks=self._validator_data[netuid].blocks[:self._num_intervals],
-                        block_data=self._validator_data[netuid].block_data[:self._num_intervals],
-                    )
+                last_weight_set_block = prev_weight_set_block
+                if interval > 0:
+                    predicted_interval = interval
+        finally:
+            self._cancel_speculative_fetches(speculative)
 
-        total_time = time.time() - start_time
-        self._print_verbose(
-            f"Subnet data gathered in {int(total_time)} seconds."
-        )
+        validator_data.truncate(count)
+
+    @staticmethod
+    def _cancel_speculative_fetches(speculative):
+        for task in speculative.values():
+            task.cancel()
+        speculative.clear()
 
     async def get_metagraph_for_netuid_at_block(self, subtensor, netuid, block):
+        # Historical blocks never change so the cache is checked first.
+        if self._metagraph_cache:
+            snapshot = self._metagraph_cache.get(netuid, int(block))
+            if snapshot is not None:
+                return snapshot
+
         #
         # For some reason this raises random errors:
         #     "Failed to decode type: "scale_info::580" with type id: 580"
@@ -346,14 +775,26 @@ class SubnetData(SubnetDataBase):
         max_attemps = 3
         for attempt in range(max_attemps):
             try:
-                return await subtensor.metagraph(
-                    netuid=netuid, block=int(block)
+                metagraph = await self._get_metagraph_fields(
+                    subtensor, netuid, int(block)
                 )
+                if self._metagraph_cache:
+                    return self._metagraph_cache.store(metagraph, int(block))
+                return metagraph
             except Exception as err:
                 self._print_verbose(
                     f"failed attempt: {attempt+1}, netuid: {netuid}, block: {block}, error: {err}"
                 )
                 error = err
+                # Rotate to the next fallback endpoint (if any were
+                # given) so the retry isn't stuck on a flaky node.
+                subtensor = await self._get_subtensor(
+                    (attempt + 1) % len(self._networks)
+                )
+                # Back off before retrying - immediately re-hitting a
+                # transiently degraded endpoint just burns attempts.
+                # asyncio.sleep only suspends this walk, never the loop.
+                await asyncio.sleep(0.5 * (1.5 ** attempt))
         self._print_verbose(
             f"Error could not obtain metagraph for netuid {netuid} at block {block} "
             f"after {max_attemps} attempts: {error}"
@@ -364,6 +805,13 @@ class SubnetData(SubnetDataBase):
 class SubnetDataFromJson(SubnetDataBase):
     json_file_name = "validator_data.json"
 
+    _json_file_base, _json_file_ext = os.path.splitext(json_file_name)
+    # Compiled once at class creation rather than on every folder scan.
+    json_file_regex = re.compile(
+        rf"^{re.escape(_json_file_base)}\.(?P<netuid>\d+)"
+        rf"{re.escape(_json_file_ext)}$"
+    )
+
     def __init__(self, netuids, json_folder, num_intervals=None, verbose=False):
         self._netuids = netuids
         self._json_folder = json_folder
@@ -380,23 +828,18 @@ class SubnetDataFromJson(SubnetDataBase):
     @classmethod
     def get_netuids_from_json_folder(cls, json_folder):
         netuids = []
-        json_file_pattern = cls.get_json_file_name(r"(?P<netuid>\d+)")
-        json_file_pattern = json_file_pattern.replace(".", r"\.")
-        json_file_regex = re.compile(rf"^{json_file_pattern}$")
-        for _file in os.listdir(json_folder):
-            regex_match = json_file_regex.match(_file)
-            if regex_match:
-                netuids.append(int(regex_match.group("netuid")))
+        # os.scandir avoids the extra per-file stat calls of os.listdir.
+        with os.scandir(json_folder) as entries:
+            for entry in entries:
+                regex_match = cls.json_file_regex.match(entry.name)
+                if regex_match:
+                    netuids.append(int(regex_match.group("netuid")))
 
         return sorted(netuids)
 
     def _get_subnet_data(self):
         for netuid in self._netuids:
-            self._validator_data[netuid] = self.ValidatorData(
-                subnet_emission=None,
-                blocks=[],
-                block_data=[],
-            )
+            self._validator_data[netuid] = self.ValidatorData.empty(None)
 
             json_file = os.path.join(
                 self._json_folder, self.get_json_file_name(netuid)
@@ -413,30 +856,127 @@ class SubnetDataFromJson(SubnetDataBase):
                 f"for netuid {netuid}."
             )
 
-            with open(json_file, "r") as fd:
-                subnet_data = json.load(fd)
+            # Parse straight off the mapped pages rather than copying
+            # the whole file into an intermediate bytes object first.
+            # orjson takes a memoryview but not an mmap directly, and
+            # the view must be released before the mapping closes.
+            with open(json_file, "rb") as fd:
+                with mmap.mmap(
+                    fd.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped:
+                    mapped_view = memoryview(mapped)
+                    try:
+                        subnet_data = orjson.loads(mapped_view)
+                    finally:
+                        mapped_view.release()
 
             subnet_data = subnet_data[str(netuid)]
 
-            block_data = []
-            for subnet_block_data in subnet_data["block_data"]:
-                block_data.append(
-                    self.BlockData(
-                        rizzo_emission=subnet_block_data["rizzo_emission"],
-                        rizzo_vtrust=subnet_block_data["rizzo_vtrust"],
-                        avg_vtrust=subnet_block_data["avg_vtrust"],
-                        rizzo_updated=subnet_block_data["rizzo_updated"],
-                    )
-                )
+            blocks = subnet_data["blocks"]
+            block_data = subnet_data["block_data"]
             if self._num_intervals:
-                self._validator_data[netuid] = self.ValidatorData(
-                    subnet_emission=subnet_data["subnet_emission"],
-                    blocks=subnet_data["blocks"][:self._num_intervals],
-                    block_data=block_data[:self._num_intervals],
-                )
-            else:
-                self._validator_data[netuid] = self.ValidatorData(
-                    subnet_emission=subnet_data["subnet_emission"],
-                    blocks=subnet_data["blocks"],
-                    block_data=block_data,
+                blocks = blocks[:self._num_intervals]
+                block_data = block_data[:self._num_intervals]
+
+            self._validator_data[netuid] = self.ValidatorData(
+                subnet_emission=subnet_data["subnet_emission"],
+                blocks=numpy.asarray(blocks, dtype=numpy.int64),
+                rizzo_emission=numpy.asarray(
+                    [bd["rizzo_emission"] for bd in block_data],
+                    dtype=numpy.float32
+                ),
+                rizzo_vtrust=numpy.asarray(
+                    [bd["rizzo_vtrust"] for bd in block_data],
+                    dtype=numpy.float32
+                ),
+                avg_vtrust=numpy.asarray(
+                    [
+                        numpy.nan if bd["avg_vtrust"] is None
+                        else bd["avg_vtrust"]
+                        for bd in block_data
+                    ],
+                    dtype=numpy.float32
+                ),
+                rizzo_updated=numpy.asarray(
+                    [bd["rizzo_updated"] for bd in block_data],
+                    dtype=numpy.int64
+                ),
+            )
+
+
+class SubnetDataFromNpz(SubnetDataBase):
+    npz_file_name = "validator_data.npz"
+
+    _npz_file_base, _npz_file_ext = os.path.splitext(npz_file_name)
+    # Compiled once at class creation rather than on every folder scan.
+    npz_file_regex = re.compile(
+        rf"^{re.escape(_npz_file_base)}\.(?P<netuid>\d+)"
+        rf"{re.escape(_npz_file_ext)}$"
+    )
+
+    def __init__(self, netuids, npz_folder, num_intervals=None, verbose=False):
+        self._netuids = netuids
+        self._npz_folder = npz_folder
+        self._num_intervals = num_intervals
+        self._other_coldkey = None
+
+        super(SubnetDataFromNpz, self).__init__(verbose)
+
+    @classmethod
+    def get_npz_file_name(cls, netuid):
+        npz_base, npz_ext = os.path.splitext(cls.npz_file_name)
+        return f"{npz_base}.{netuid}{npz_ext}"
+
+    @classmethod
+    def get_netuids_from_npz_folder(cls, npz_folder):
+        netuids = []
+        # os.scandir avoids the extra per-file stat calls of os.listdir.
+        with os.scandir(npz_folder) as entries:
+            for entry in entries:
+                regex_match = cls.npz_file_regex.match(entry.name)
+                if regex_match:
+                    netuids.append(int(regex_match.group("netuid")))
+
+        return sorted(netuids)
+
+    def _get_subnet_data(self):
+        for netuid in self._netuids:
+            self._validator_data[netuid] = self.ValidatorData.empty(None)
+
+            npz_file = os.path.join(
+                self._npz_folder, self.get_npz_file_name(netuid)
+            )
+            if not os.path.isfile(npz_file):
+                self._print_verbose(
+                    f"Existing npz file ({npz_file}) for netuid "
+                    f"{netuid} does not exist."
                 )
+                continue
+
+            self._print_verbose(
+                f"Obtaining existing data from npz file ({npz_file}) "
+                f"for netuid {netuid}."
+            )
+
+            # The arrays were written in their storage dtypes, so
+            # loading is decompression into ready-to-use arrays with no
+            # per-value parsing or conversion.
+            with numpy.load(npz_file) as npz_data:
+                subnet_emission = float(npz_data["subnet_emission"])
+                arrays = {
+                    field: npz_data[field]
+                    for field in self.ValidatorData.array_dtypes
+                }
+
+            if self._num_intervals:
+                arrays = {
+                    field: array[:self._num_intervals]
+                    for field, array in arrays.items()
+                }
+
+            self._validator_data[netuid] = self.ValidatorData(
+                subnet_emission=(
+                    None if math.isnan(subnet_emission) else subnet_emission
+                ),
+                **arrays
+            )
@@ -1,4 +1,6 @@
 # standard imports
+import numpy
+
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
@@ -13,9 +15,9 @@ from subnet_constants import (
 
 
 class RichPrinter:
-    _red = "9"
-    _green = "10"
-    _yellow = "11"
+    # Style strings indexed by status (0=ok, 1=warning, 2=error) -
+    # built once instead of a per-cell f-string allocation.
+    _styles = ("color(10)", "color(11)", "color(9)")
 
     def __new__(cls, *args, **kwargs):
         if kwargs["print_tables"]:
@@ -32,28 +34,30 @@ class RichPrinter:
         self._print_data()
 
     def _get_style(self, status):
-        if status == 2:
-            return f"color({self._red})"
-        elif status == 1:
-                return f"color({self._yellow})"
-        else:
-            return f"color({self._green})"
-    
-    def _get_blocks_status(self, blocks):
-        if  blocks > UPDATED_ERROR_THRESHOLD:
-            return 2
-        if blocks > UPDATED_WARNING_THRESHOLD:
-            return 1
-        return 0
-
-    def _get_vtrust_status(self, vtrust, avg_vtrust):
-        if avg_vtrust is None:
-            return 1
-        if (avg_vtrust - vtrust) > VTRUST_ERROR_THRESHOLD:
-            return 2
-        if (avg_vtrust - vtrust) > VTRUST_WARNING_THRESHOLD:
-            return 1
-        return 0
+        return self._styles[status]
+
+
+    def _get_statuses(self, subnet_data):
+        # Classify every interval of a subnet in one vectorized pass
+        # instead of calling per-value helpers from the print loops.
+        # The error threshold sits above the warning threshold, so
+        # summing the two comparison vectors maps directly onto the
+        # 0/1/2 status encoding without any numpy.where selection.
+        blocks = subnet_data.rizzo_updated
+        blocks_statuses = (
+            (blocks > UPDATED_WARNING_THRESHOLD).astype(numpy.int64)
+            + (blocks > UPDATED_ERROR_THRESHOLD)
+        )
+
+        vtrust_diffs = subnet_data.avg_vtrust - subnet_data.rizzo_vtrust
+        vtrust_statuses = (
+            (vtrust_diffs > VTRUST_WARNING_THRESHOLD).astype(numpy.int64)
+            + (vtrust_diffs > VTRUST_ERROR_THRESHOLD)
+        )
+        # NaN means there were no other valid validators to average.
+        vtrust_statuses[numpy.isnan(vtrust_diffs)] = 1
+
+        return blocks_statuses.tolist(), vtrust_statuses.tolist()
 
     def _print_data(self):
         raise NotImplementedError
@@ -75,7 +79,7 @@ class RichTextPrinter(RichPrinter):
 
             subnet_data = self._validator_data[netuid]
 
-            if not subnet_data.blocks:
+            if not len(subnet_data.blocks):
                 text.append(
                     f"\nRizzo validator not running on subnet {netuid}",
                     style=self._get_style(2)
@@ -85,16 +89,17 @@ class RichTextPrinter(RichPrinter):
 
             text.append(f"\nSubnet {netuid} ({subnet_data.subnet_emission:.2f}%):")
 
+            blocks_statuses, vtrust_statuses = self._get_statuses(subnet_data)
+
             interval_blocks = []
             interval_vtrusts = []
-            for subnet_block in subnet_data.block_data:
-                blocks = subnet_block.rizzo_updated
-                blocks_status = self._get_blocks_status(blocks)
+            for blocks, vtrust, blocks_status, vtrust_status in zip(
+                subnet_data.rizzo_updated.tolist(),
+                subnet_data.rizzo_vtrust.tolist(),
+                blocks_statuses,
+                vtrust_statuses,
+            ):
                 blocks = str(blocks)
-
-                vtrust = subnet_block.rizzo_vtrust
-                avg_vtrust = subnet_block.avg_vtrust
-                vtrust_status = self._get_vtrust_status(vtrust, avg_vtrust)
                 vtrust = f"{vtrust:.3f}"
         
                 max_chars = max(len(blocks), len(vtrust))
@@ -134,22 +139,32 @@ class RichTablePrinter(RichPrinter):
             blocks_row = ["Updated"]
             vtrusts_row = ["Vtrust"]
 
-            if not subnet_data.blocks:
+            # Cells are markup strings rather than rich.text.Text objects
+            # so rich parses the style once per render instead of the
+            # loop allocating a styled Text per cell.
+            if not len(subnet_data.blocks):
                 table.add_column("", justify="center", no_wrap=True)
-                blocks_row.append(Text("---", style=self._get_style(2)))
-                vtrusts_row.append(Text("---", style=self._get_style(2)))
+                blocks_row.append(f"[{self._get_style(2)}]---[/]")
+                vtrusts_row.append(f"[{self._get_style(2)}]---[/]")
             else:
-                for subnet_block in reversed(subnet_data.block_data):
+                blocks_statuses, vtrust_statuses = (
+                    self._get_statuses(subnet_data)
+                )
+                for blocks, vtrust, blocks_status, vtrust_status in zip(
+                    subnet_data.rizzo_updated.tolist()[::-1],
+                    subnet_data.rizzo_vtrust.tolist()[::-1],
+                    blocks_statuses[::-1],
+                    vtrust_statuses[::-1],
+                ):
                     table.add_column("", justify="center", no_wrap=True)
 
-                    blocks = subnet_block.rizzo_updated
-                    blocks_status = self._get_blocks_status(blocks)
-                    blocks_row.append(Text(str(blocks), style=self._get_style(blocks_status)))
+                    blocks_row.append(
+                        f"[{self._get_style(blocks_status)}]{blocks}[/]"
+                    )
 
-                    vtrust = subnet_block.rizzo_vtrust
-                    avg_vtrust = subnet_block.avg_vtrust
-                    vtrust_status = self._get_vtrust_status(vtrust, avg_vtrust)
-                    vtrusts_row.append(Text(f"{vtrust:.3f}", style=self._get_style(vtrust_status)))
+                    vtrusts_row.append(
+                        f"[{self._get_style(vtrust_status)}]{vtrust:.3f}[/]"
+                    )
 
             table.add_row(*blocks_row)
             table.add_row(*vtrusts_row)